@@ -0,0 +1,11 @@
+"""ASGI entry point.
+
+Run the server against this module (`uvicorn asgi:app`) instead of
+importing main directly: when the Cython-compiled extension built by
+setup.py is present it shadows main.py, so the app runs with compiled
+request handlers at no source change.
+"""
+
+from main import app
+
+__all__ = ["app"]
@@ -1,390 +1,650 @@
+import hashlib
+from contextlib import asynccontextmanager
 from typing import List, Optional
 from datetime import date
 
-from fastapi import FastAPI, HTTPException, Depends
-from sqlmodel import Field, SQLModel, create_engine, Session, Relationship, select
-
-# ---------- MODELS & SCHEMAS ----------
-
-class ClassroomStudent(SQLModel, table=True):
-    classroom_id: Optional[int] = Field(
-        default=None, foreign_key="classroom.id", primary_key=True
-    )
-    student_id: Optional[int] = Field(
-        default=None, foreign_key="student.id", primary_key=True
-    )
-
-class StudentBase(SQLModel):
-    name: str
-    contact_number: str
-    dob: date
-
-class Student(StudentBase, table=True):
-    id: Optional[int] = Field(default=None, primary_key=True)
-    classrooms: List["Classroom"] = Relationship(
-        back_populates="students", link_model=ClassroomStudent
-    )
-    issues: List["Issue"] = Relationship(back_populates="student")
-    results: List["ExamResult"] = Relationship(back_populates="student")
-    fees: List["ExamFee"] = Relationship(back_populates="student")
-
-class StaffBase(SQLModel):
-    name: str
-    contact_number: str
-    dob: date
-
-class Staff(StaffBase, table=True):
-    id: Optional[int] = Field(default=None, primary_key=True)
-
-class ClassroomBase(SQLModel):
+import msgspec
+from fastapi import FastAPI, HTTPException, Depends, Response
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.decorator import cache
+from redis import asyncio as aioredis
+from sqlalchemy import bindparam, event, func
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlmodel import SQLModel, delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models import (
+    Book,
+    BookBase,
+    Classroom,
+    ClassroomBase,
+    ClassroomStudent,
+    ExamFee,
+    ExamFeeBase,
+    ExamResult,
+    Issue,
+    Staff,
+    StaffBase,
+    Student,
+    StudentBase,
+)
+
+# ---------- READ SCHEMAS ----------
+
+# msgspec read schemas: encoding a Struct tree with
+# msgspec.json sidesteps the Pydantic serialization pipeline entirely on
+# the hottest GET paths. frozen slotted instances with gc tracking off
+# keep the per-row footprint minimal when thousands are materialized;
+# the trees are built once and never form cycles.
+
+class ClassroomReadMS(msgspec.Struct, frozen=True, gc=False):
+    id: int
     class_name: str
     std: str
     sec: str
     class_teacher: str
 
-class Classroom(ClassroomBase, table=True):
-    id: Optional[int] = Field(default=None, primary_key=True)
-    students: List[Student] = Relationship(
-        back_populates="classrooms", link_model=ClassroomStudent
-    )
-
-class BookBase(SQLModel):
+class BookReadMS(msgspec.Struct, frozen=True, gc=False):
+    id: int
     title: str
     author: str
     isbn: str
     total_copies: int
-
-class Book(BookBase, table=True):
-    id: Optional[int] = Field(default=None, primary_key=True)
-    available_copies: int = Field(default=0)
-    issues: List["Issue"] = Relationship(back_populates="book")
-
-class Issue(SQLModel, table=True):
-    id: Optional[int] = Field(default=None, primary_key=True)
-    student_id: int = Field(foreign_key="student.id")
-    book_id: int = Field(foreign_key="book.id")
-    issue_date: date = Field(default_factory=date.today)
-    return_date: Optional[date] = None
-
-    student: Student = Relationship(back_populates="issues")
-    book: Book = Relationship(back_populates="issues")
-
-class ExamResult(SQLModel, table=True):
-    id: Optional[int] = Field(default=None, primary_key=True)
-    student_id: int = Field(foreign_key="student.id")
-    exam_name: str
-    marks_obtained: float
-    max_marks: float
-
-    student: Student = Relationship(back_populates="results")
-
-class ExamFee(SQLModel, table=True):
-    id: Optional[int] = Field(default=None, primary_key=True)
-    student_id: int = Field(foreign_key="student.id")
-    amount: float
-    due_date: date
-    paid: bool = Field(default=False)
-
-    student: Student = Relationship(back_populates="fees")
-
-
-class ClassroomRead(ClassroomBase):
-    id: int
-
-class BookRead(BookBase):
-    id: int
     available_copies: int
 
-class IssueRead(SQLModel):
+class IssueReadMS(msgspec.Struct, frozen=True, gc=False):
     id: int
     issue_date: date
-    return_date: Optional[date]
-    book: BookRead
+    book: BookReadMS
+    return_date: Optional[date] = None
 
-class ExamResultRead(SQLModel):
-  
+class ExamResultReadMS(msgspec.Struct, frozen=True, gc=False):
     exam_name: str
     marks_obtained: float
     max_marks: float
 
-class ExamFeeRead(SQLModel):
+class ExamFeeReadMS(msgspec.Struct, frozen=True, gc=False):
     id: int
     amount: float
     due_date: date
     paid: bool
 
-class StudentRead(StudentBase):
+class StudentReadMS(msgspec.Struct, frozen=True, gc=False):
     id: int
-    classrooms: List[ClassroomRead]
-    issues: List[IssueRead]
-    results: List[ExamResultRead]
-    fees: List[ExamFeeRead]
+    name: str
+    contact_number: str
+    dob: date
+    classrooms: List[ClassroomReadMS]
+    issues: List[IssueReadMS]
+    results: List[ExamResultReadMS]
+    fees: List[ExamFeeReadMS]
+
+def build_issue_read(issue: Issue) -> IssueReadMS:
+    return IssueReadMS(
+        id=issue.id,
+        issue_date=issue.issue_date,
+        return_date=issue.return_date,
+        book=BookReadMS(
+            id=issue.book.id,
+            title=issue.book.title,
+            author=issue.book.author,
+            isbn=issue.book.isbn,
+            total_copies=issue.book.total_copies,
+            available_copies=issue.book.available_copies,
+        ),
+    )
 
+def build_student_read(db_student: Student) -> StudentReadMS:
+    """Assemble the get_student response as a msgspec Struct tree.
+
+    The rows were just produced by SQLAlchemy and already satisfy the
+    constraints the DB schema enforces, so no validation pass runs.
+    """
+    return StudentReadMS(
+        id=db_student.id,
+        name=db_student.name,
+        contact_number=db_student.contact_number,
+        dob=db_student.dob,
+        classrooms=[
+            ClassroomReadMS(
+                id=c.id,
+                class_name=c.class_name,
+                std=c.std,
+                sec=c.sec,
+                class_teacher=c.class_teacher,
+            )
+            for c in db_student.classrooms
+        ],
+        issues=[build_issue_read(i) for i in db_student.issues],
+        results=[
+            ExamResultReadMS(
+                exam_name=r.exam_name,
+                marks_obtained=r.marks_obtained,
+                max_marks=r.max_marks,
+            )
+            for r in db_student.results
+        ],
+        fees=[
+            ExamFeeReadMS(
+                id=f.id, amount=f.amount, due_date=f.due_date, paid=f.paid
+            )
+            for f in db_student.fees
+        ],
+    )
 
-# ---------- DATABASE SETUP ----------
 
-DATABASE_URL = "sqlite:///./school.db"
-engine = create_engine(DATABASE_URL, echo=False)
+# ---------- PRECOMPILED STATEMENTS ----------
+
+# Built once at import time so request handlers skip re-constructing the
+# SQL expression tree; the per-student statements take their id as an
+# execution-time parameter.
+_STMT_LIST_STUDENTS = select(Student)
+_STMT_LIST_STAFF = select(Staff)
+_STMT_LIST_CLASSROOMS = select(Classroom)
+_STMT_LIST_BOOKS = select(Book)
+_STMT_LIST_RESULTS = select(ExamResult)
+_STMT_LIST_FEES = select(ExamFee)
+_STMT_ISSUES_BY_STUDENT = (
+    select(Issue)
+    .where(Issue.student_id == bindparam("student_id"))
+    .options(joinedload(Issue.book))
+)
+_STMT_RESULTS_BY_STUDENT = select(ExamResult).where(ExamResult.student_id == bindparam("student_id"))
+_STMT_FEES_BY_STUDENT = select(ExamFee).where(ExamFee.student_id == bindparam("student_id"))
+
+# COUNT(*) statements backing the X-Total-Count header on list endpoints.
+_STMT_COUNT_STUDENTS = select(func.count()).select_from(Student)
+_STMT_COUNT_STAFF = select(func.count()).select_from(Staff)
+_STMT_COUNT_CLASSROOMS = select(func.count()).select_from(Classroom)
+_STMT_COUNT_BOOKS = select(func.count()).select_from(Book)
+_STMT_COUNT_RESULTS = select(func.count()).select_from(ExamResult)
+_STMT_COUNT_FEES = select(func.count()).select_from(ExamFee)
 
-def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
+# ---------- DATABASE SETUP ----------
 
-def get_session():
-    with Session(engine) as session:
+DATABASE_URL = "sqlite+aiosqlite:///./school.db"
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=20,
+    max_overflow=30,
+    pool_timeout=30,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+)
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every new SQLite connection: WAL keeps readers from blocking
+    writers and turns each commit into a single append to the log."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+async def create_db_and_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+# Sessions never expire loaded instances on commit: each request owns its
+# session, so post-commit attribute reads are served from memory instead
+# of re-triggering a SELECT while the response is built.
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+async def get_session():
+    async with SessionLocal() as session:
         yield session
 
+async def warm_up():
+    """Pay first-hit costs at startup instead of on the first request.
+
+    Executes every precompiled statement once with LIMIT 0 so mapper
+    configuration, statement compilation and a pooled connection (with
+    its PRAGMAs) are all warm, then touches the msgspec schemas so their
+    encoder state is built.
+    """
+    async with SessionLocal() as session:
+        for stmt in (
+            _STMT_LIST_STUDENTS,
+            _STMT_LIST_STAFF,
+            _STMT_LIST_CLASSROOMS,
+            _STMT_LIST_BOOKS,
+            _STMT_LIST_RESULTS,
+            _STMT_LIST_FEES,
+            _STMT_COUNT_STUDENTS,
+            _STMT_COUNT_STAFF,
+            _STMT_COUNT_CLASSROOMS,
+            _STMT_COUNT_BOOKS,
+            _STMT_COUNT_RESULTS,
+            _STMT_COUNT_FEES,
+        ):
+            await session.exec(stmt.limit(0))
+        for stmt in (
+            _STMT_ISSUES_BY_STUDENT,
+            _STMT_RESULTS_BY_STUDENT,
+            _STMT_FEES_BY_STUDENT,
+        ):
+            await session.exec(stmt.limit(0), params={"student_id": 0})
+    for schema in (
+        StudentReadMS,
+        ClassroomReadMS,
+        BookReadMS,
+        IssueReadMS,
+        ExamResultReadMS,
+        ExamFeeReadMS,
+    ):
+        msgspec.json.schema(schema)
+
+# ---------- RESPONSE CACHE ----------
+
+REDIS_URL = "redis://localhost:6379"
+CACHE_PREFIX = "school"
+
+def no_db_session_key_builder(
+    func, namespace="", *, request=None, response=None, args=(), kwargs=None
+):
+    """Build cache keys from the endpoint arguments only: the injected DB
+    session differs on every request and must not end up in the key."""
+    kwargs = {k: v for k, v in (kwargs or {}).items() if k != "session"}
+    cache_key = hashlib.md5(
+        f"{func.__module__}:{func.__name__}:{args}:{kwargs}".encode()
+    ).hexdigest()
+    return f"{namespace}:{cache_key}"
+
+async def clear_cache():
+    """Drop cached responses after a write so reads never serve stale rows.
+
+    Called without arguments so FastAPICache prefixes the namespace itself:
+    passing CACHE_PREFIX here would produce "school:school" and match
+    nothing, silently turning invalidation into a no-op.
+    """
+    await FastAPICache.clear()
+
 # ---------- FASTAPI APP ----------
 
-app = FastAPI(on_startup=[create_db_and_tables])
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await create_db_and_tables()
+    await warm_up()
+    FastAPICache.init(
+        RedisBackend(aioredis.from_url(REDIS_URL)),
+        prefix=CACHE_PREFIX,
+        key_builder=no_db_session_key_builder,
+    )
+    yield
+    # Close pooled aiosqlite connections; each owns a non-daemon thread
+    # that would otherwise keep the process alive after shutdown.
+    await engine.dispose()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # ---------- STUDENT CRUD ----------
 
 @app.post("/students/", response_model=Student)
-def create_student(student: StudentBase, session: Session = Depends(get_session)):
+async def create_student(student: StudentBase, session: AsyncSession = Depends(get_session)):
     db_student = Student(**student.dict())
     session.add(db_student)
-    session.commit()
-    session.refresh(db_student)
+    await session.commit()
     return db_student
 
-@app.get("/students/", response_model=List[Student])
-def list_students(session: Session = Depends(get_session)):
-    return session.exec(select(Student)).all()
-
-@app.get("/students/{student_id}", response_model=StudentRead)
-def get_student(student_id: int, session: Session = Depends(get_session)):
-    db_student = session.get(Student, student_id)
+@app.post("/students/bulk/", response_model=List[Student])
+async def create_students_bulk(students: List[StudentBase], session: AsyncSession = Depends(get_session)):
+    db_students = [Student(**s.dict()) for s in students]
+    session.add_all(db_students)
+    await session.commit()
+    return db_students
+
+@app.get("/students/")
+async def list_students(response: Response, limit: int = 50, offset: int = 0, session: AsyncSession = Depends(get_session)):
+    response.headers["X-Total-Count"] = str((await session.exec(_STMT_COUNT_STUDENTS)).one())
+    return (await session.exec(_STMT_LIST_STUDENTS.limit(limit).offset(offset))).all()
+
+@app.get("/students/{student_id}")
+async def get_student(student_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.exec(
+        select(Student)
+        .where(Student.id == student_id)
+        .options(
+            selectinload(Student.classrooms),
+            selectinload(Student.issues).joinedload(Issue.book),
+            selectinload(Student.results),
+            selectinload(Student.fees),
+            raiseload("*"),
+        )
+    )
+    db_student = result.one_or_none()
     if not db_student:
         raise HTTPException(status_code=404, detail="Student not found")
-    return db_student
+    return Response(
+        msgspec.json.encode(build_student_read(db_student)),
+        media_type="application/json",
+    )
 
 @app.put("/students/{student_id}", response_model=Student)
-def update_student(student_id: int, student: StudentBase, session: Session = Depends(get_session)):
-    db_student = session.get(Student, student_id)
+async def update_student(student_id: int, student: StudentBase, session: AsyncSession = Depends(get_session)):
+    db_student = await session.get(Student, student_id)
     if not db_student:
         raise HTTPException(status_code=404, detail="Student not found")
-    for key, val in student.dict().items():
-        setattr(db_student, key, val)
-    session.commit()
-    session.refresh(db_student)
+    db_student.sqlmodel_update(student.model_dump(exclude_unset=True))
+    session.add(db_student)
+    await session.commit()
     return db_student
 
 @app.delete("/students/{student_id}", status_code=204)
-def delete_student(student_id: int, session: Session = Depends(get_session)):
-    db_student = session.get(Student, student_id)
-    if not db_student:
+async def delete_student(student_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.exec(delete(Student).where(Student.id == student_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Student not found")
-    session.delete(db_student)
-    session.commit()
+    await session.commit()
+    # The cascade also removed the student's fee rows, which feed the
+    # cached /fees/ listing.
+    await clear_cache()
 
 # ---------- STAFF CRUD ----------
 
 @app.post("/staff/", response_model=Staff)
-def create_staff(staff: StaffBase, session: Session = Depends(get_session)):
+async def create_staff(staff: StaffBase, session: AsyncSession = Depends(get_session)):
     db_staff = Staff(**staff.dict())
     session.add(db_staff)
-    session.commit()
-    session.refresh(db_staff)
+    await session.commit()
     return db_staff
 
-@app.get("/staff/", response_model=List[Staff])
-def list_staff(session: Session = Depends(get_session)):
-    return session.exec(select(Staff)).all()
+@app.get("/staff/")
+async def list_staff(response: Response, limit: int = 50, offset: int = 0, session: AsyncSession = Depends(get_session)):
+    response.headers["X-Total-Count"] = str((await session.exec(_STMT_COUNT_STAFF)).one())
+    return (await session.exec(_STMT_LIST_STAFF.limit(limit).offset(offset))).all()
 
-@app.get("/staff/{staff_id}", response_model=Staff)
-def get_staff(staff_id: int, session: Session = Depends(get_session)):
-    db_staff = session.get(Staff, staff_id)
+@app.get("/staff/{staff_id}")
+async def get_staff(staff_id: int, session: AsyncSession = Depends(get_session)):
+    db_staff = await session.get(Staff, staff_id)
     if not db_staff:
         raise HTTPException(status_code=404, detail="Staff not found")
     return db_staff
 
 @app.put("/staff/{staff_id}", response_model=Staff)
-def update_staff(staff_id: int, staff: StaffBase, session: Session = Depends(get_session)):
-    db_staff = session.get(Staff, staff_id)
+async def update_staff(staff_id: int, staff: StaffBase, session: AsyncSession = Depends(get_session)):
+    db_staff = await session.get(Staff, staff_id)
     if not db_staff:
         raise HTTPException(status_code=404, detail="Staff not found")
-    for key, val in staff.dict().items():
-        setattr(db_staff, key, val)
-    session.commit()
-    session.refresh(db_staff)
+    db_staff.sqlmodel_update(staff.model_dump(exclude_unset=True))
+    session.add(db_staff)
+    await session.commit()
     return db_staff
 
 @app.delete("/staff/{staff_id}", status_code=204)
-def delete_staff(staff_id: int, session: Session = Depends(get_session)):
-    db_staff = session.get(Staff, staff_id)
-    if not db_staff:
+async def delete_staff(staff_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.exec(delete(Staff).where(Staff.id == staff_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Staff not found")
-    session.delete(db_staff)
-    session.commit()
+    await session.commit()
 
 # ---------- CLASSROOMS ----------
 
 @app.post("/classrooms/", response_model=Classroom)
-def create_classroom(classroom: ClassroomBase, session: Session = Depends(get_session)):
+async def create_classroom(classroom: ClassroomBase, session: AsyncSession = Depends(get_session)):
     db_class = Classroom(**classroom.dict())
     session.add(db_class)
-    session.commit()
-    session.refresh(db_class)
+    await session.commit()
+    await clear_cache()
     return db_class
 
-@app.get("/classrooms/", response_model=List[Classroom])
-def list_classrooms(session: Session = Depends(get_session)):
-    return session.exec(select(Classroom)).all()
+# The cached list bodies live in helpers so the X-Total-Count header can
+# be computed outside the cache: on a hit the endpoint body still runs,
+# so the header is always present and reflects the current COUNT(*),
+# while the row materialization it fronts is still served from cache.
+
+@cache(expire=60)
+async def _list_classrooms_cached(limit: int, offset: int, session: AsyncSession):
+    return (await session.exec(_STMT_LIST_CLASSROOMS.limit(limit).offset(offset))).all()
+
+@app.get("/classrooms/")
+async def list_classrooms(response: Response, limit: int = 50, offset: int = 0, session: AsyncSession = Depends(get_session)):
+    response.headers["X-Total-Count"] = str((await session.exec(_STMT_COUNT_CLASSROOMS)).one())
+    return await _list_classrooms_cached(limit=limit, offset=offset, session=session)
 
 @app.post("/classrooms/{class_id}/add_student/{student_id}", response_model=Classroom)
-def add_student_to_class(class_id: int, student_id: int, session: Session = Depends(get_session)):
-    db_class = session.get(Classroom, class_id)
-    db_student = session.get(Student, student_id)
+async def add_student_to_class(class_id: int, student_id: int, session: AsyncSession = Depends(get_session)):
+    db_class = await session.get(Classroom, class_id)
+    db_student = await session.get(Student, student_id)
     if not db_class or not db_student:
         raise HTTPException(status_code=404, detail="Class or Student not found")
-    if db_student in db_class.students:
+    result = await session.exec(
+        select(ClassroomStudent).where(
+            ClassroomStudent.classroom_id == class_id,
+            ClassroomStudent.student_id == student_id,
+        )
+    )
+    link = result.first()
+    if link:
         raise HTTPException(status_code=400, detail="Student already in class")
-    db_class.students.append(db_student)
-    session.commit()
-    session.refresh(db_class)
+    session.add(ClassroomStudent(classroom_id=class_id, student_id=student_id))
+    await session.commit()
     return db_class
 
 @app.post("/classrooms/{class_id}/remove_student/{student_id}", response_model=Classroom)
-def remove_student_from_class(class_id: int, student_id: int, session: Session = Depends(get_session)):
-    db_class = session.get(Classroom, class_id)
-    db_student = session.get(Student, student_id)
+async def remove_student_from_class(class_id: int, student_id: int, session: AsyncSession = Depends(get_session)):
+    db_class = await session.get(Classroom, class_id)
+    db_student = await session.get(Student, student_id)
     if not db_class or not db_student:
         raise HTTPException(status_code=404, detail="Class or Student not found")
-    if db_student not in db_class.students:
+    result = await session.exec(
+        select(ClassroomStudent).where(
+            ClassroomStudent.classroom_id == class_id,
+            ClassroomStudent.student_id == student_id,
+        )
+    )
+    link = result.first()
+    if not link:
         raise HTTPException(status_code=400, detail="Student not in class")
-    db_class.students.remove(db_student)
-    session.commit()
-    session.refresh(db_class)
+    await session.delete(link)
+    await session.commit()
     return db_class
 
-@app.get("/classrooms/{class_id}/students", response_model=List[Student])
-def get_class_students(class_id: int, session: Session = Depends(get_session)):
-    db_class = session.get(Classroom, class_id)
+@app.get("/classrooms/{class_id}/students")
+async def get_class_students(class_id: int, session: AsyncSession = Depends(get_session)):
+    db_class = await session.get(Classroom, class_id)
     if not db_class:
         raise HTTPException(status_code=404, detail="Class not found")
-    return db_class.students
+    result = await session.exec(
+        select(Student)
+        .join(ClassroomStudent, ClassroomStudent.student_id == Student.id)
+        .where(ClassroomStudent.classroom_id == class_id)
+    )
+    return result.all()
 
 # ---------- LIBRARY ----------
 
 @app.post("/books/", response_model=Book)
-def add_book(book: BookBase, session: Session = Depends(get_session)):
+async def add_book(book: BookBase, session: AsyncSession = Depends(get_session)):
     db_book = Book(**book.dict(), available_copies=book.total_copies)
     session.add(db_book)
-    session.commit()
-    session.refresh(db_book)
+    await session.commit()
+    await clear_cache()
     return db_book
 
-@app.get("/books/", response_model=List[Book])
-def list_books(session: Session = Depends(get_session)):
-    return session.exec(select(Book)).all()
-
-@app.get("/books/{book_id}", response_model=Book)
-def get_book(book_id: int, session: Session = Depends(get_session)):
-    db_book = session.get(Book, book_id)
+@app.post("/books/bulk/", response_model=List[Book])
+async def add_books_bulk(books: List[BookBase], session: AsyncSession = Depends(get_session)):
+    db_books = [Book(**b.dict(), available_copies=b.total_copies) for b in books]
+    session.add_all(db_books)
+    await session.commit()
+    await clear_cache()
+    return db_books
+
+@cache(expire=60)
+async def _list_books_cached(limit: int, offset: int, session: AsyncSession):
+    return (await session.exec(_STMT_LIST_BOOKS.limit(limit).offset(offset))).all()
+
+@app.get("/books/")
+async def list_books(response: Response, limit: int = 50, offset: int = 0, session: AsyncSession = Depends(get_session)):
+    response.headers["X-Total-Count"] = str((await session.exec(_STMT_COUNT_BOOKS)).one())
+    return await _list_books_cached(limit=limit, offset=offset, session=session)
+
+@app.get("/books/{book_id}")
+@cache(expire=60)
+async def get_book(book_id: int, session: AsyncSession = Depends(get_session)):
+    db_book = await session.get(Book, book_id)
     if not db_book:
         raise HTTPException(status_code=404, detail="Book not found")
     return db_book
 
 @app.post("/issues/", response_model=Issue)
-def issue_book(issue: Issue, session: Session = Depends(get_session)):
-    db_book = session.get(Book, issue.book_id)
-    if not db_book or db_book.available_copies < 1:
+async def issue_book(issue: Issue, session: AsyncSession = Depends(get_session)):
+    result = await session.exec(
+        update(Book)
+        .where(Book.id == issue.book_id, Book.available_copies > 0)
+        .values(available_copies=Book.available_copies - 1)
+    )
+    if result.rowcount == 0:
         raise HTTPException(status_code=400, detail="Book unavailable")
-    db_book.available_copies -= 1
-    session.add(db_book)
     session.add(issue)
-    session.commit()
-    session.refresh(issue)
+    await session.commit()
+    await clear_cache()
     return issue
 
 @app.post("/returns/{issue_id}", response_model=Issue)
-def return_book(issue_id: int, session: Session = Depends(get_session)):
-    db_issue = session.get(Issue, issue_id)
-    if not db_issue or db_issue.return_date:
+async def return_book(issue_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.exec(
+        update(Issue)
+        .where(Issue.id == issue_id, Issue.return_date == None)
+        .values(return_date=date.today())
+    )
+    if result.rowcount == 0:
         raise HTTPException(status_code=400, detail="Invalid return")
-    db_issue.return_date = date.today()
-    db_book = session.get(Book, db_issue.book_id)
-    db_book.available_copies += 1
-    session.add_all([db_issue, db_book])
-    session.commit()
-    session.refresh(db_issue)
+    db_issue = await session.get(Issue, issue_id)
+    await session.exec(
+        update(Book)
+        .where(Book.id == db_issue.book_id)
+        .values(available_copies=Book.available_copies + 1)
+    )
+    await session.commit()
+    await clear_cache()
     return db_issue
 
-@app.get("/students/{student_id}/issues", response_model=List[Issue])
-def student_issues(student_id: int, session: Session = Depends(get_session)):
-    return session.exec(select(Issue).where(Issue.student_id == student_id)).all()
+@app.get("/students/{student_id}/issues")
+async def student_issues(student_id: int, session: AsyncSession = Depends(get_session)):
+    issues = (
+        await session.exec(_STMT_ISSUES_BY_STUDENT, params={"student_id": student_id})
+    ).unique().all()
+    return Response(
+        msgspec.json.encode([build_issue_read(i) for i in issues]),
+        media_type="application/json",
+    )
 
 # ---------- EXAM RESULTS ----------
 
 @app.post("/results/", response_model=ExamResult)
-def add_result(result: ExamResult, session: Session = Depends(get_session)):
+async def add_result(result: ExamResult, session: AsyncSession = Depends(get_session)):
     session.add(result)
-    session.commit()
-    session.refresh(result)
+    await session.commit()
     return result
 
-@app.get("/results/", response_model=List[ExamResult])
-def list_results(session: Session = Depends(get_session)):
-    return session.exec(select(ExamResult)).all()
-
-@app.get("/students/{student_id}/results", response_model=List[ExamResult])
-def get_results(student_id: int, session: Session = Depends(get_session)):
-    return session.exec(select(ExamResult).where(ExamResult.student_id == student_id)).all()
-
-@app.get("/results/{result_id}", response_model=ExamResult)
-def get_result(result_id: int, session: Session = Depends(get_session)):
-    db_result = session.get(ExamResult, result_id)
+@app.post("/results/bulk/", response_model=List[ExamResult])
+async def add_results_bulk(results: List[ExamResult], session: AsyncSession = Depends(get_session)):
+    session.add_all(results)
+    await session.commit()
+    return results
+
+@app.get("/results/")
+async def list_results(response: Response, limit: int = 50, offset: int = 0, session: AsyncSession = Depends(get_session)):
+    response.headers["X-Total-Count"] = str((await session.exec(_STMT_COUNT_RESULTS)).one())
+    return (await session.exec(_STMT_LIST_RESULTS.limit(limit).offset(offset))).all()
+
+@app.get("/students/{student_id}/results")
+async def get_results(student_id: int, session: AsyncSession = Depends(get_session)):
+    return (
+        await session.exec(_STMT_RESULTS_BY_STUDENT, params={"student_id": student_id})
+    ).all()
+
+@app.get("/results/{result_id}")
+async def get_result(result_id: int, session: AsyncSession = Depends(get_session)):
+    db_result = await session.get(ExamResult, result_id)
     if not db_result:
         raise HTTPException(status_code=404, detail="Result not found")
     return db_result
 
 @app.delete("/results/{result_id}", status_code=204)
-def delete_result(result_id: int, session: Session = Depends(get_session)):
-    db_result = session.get(ExamResult, result_id)
-    if not db_result:
+async def delete_result(result_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.exec(delete(ExamResult).where(ExamResult.id == result_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Result not found")
-    session.delete(db_result)
-    session.commit()
+    await session.commit()
 
 # ---------- EXAM FEES ----------
 
 @app.post("/fees/", response_model=ExamFee)
-def add_fee(fee: ExamFee, session: Session = Depends(get_session)):
-    session.add(fee)
-    session.commit()
-    session.refresh(fee)
-    return fee
-
-@app.get("/students/{student_id}/fees", response_model=List[ExamFee])
-def get_fees(student_id: int, session: Session = Depends(get_session)):
-    return session.exec(select(ExamFee).where(ExamFee.student_id == student_id)).all()
-
-@app.get("/fees/", response_model=List[ExamFee])
-def list_fees(session: Session = Depends(get_session)):
-    return session.exec(select(ExamFee)).all()
-
-@app.get("/fees/{fee_id}", response_model=ExamFee)
-def get_fee(fee_id: int, session: Session = Depends(get_session)):
-    db_fee = session.get(ExamFee, fee_id)
+async def add_fee(fee: ExamFeeBase, session: AsyncSession = Depends(get_session)):
+    db_fee = ExamFee(**fee.dict())
+    session.add(db_fee)
+    await session.commit()
+    await clear_cache()
+    return db_fee
+
+@app.post("/fees/bulk/", response_model=List[ExamFee])
+async def add_fees_bulk(fees: List[ExamFeeBase], session: AsyncSession = Depends(get_session)):
+    db_fees = [ExamFee(**f.dict()) for f in fees]
+    session.add_all(db_fees)
+    await session.commit()
+    await clear_cache()
+    return db_fees
+
+@app.get("/students/{student_id}/fees")
+async def get_fees(student_id: int, session: AsyncSession = Depends(get_session)):
+    return (
+        await session.exec(_STMT_FEES_BY_STUDENT, params={"student_id": student_id})
+    ).all()
+
+@cache(expire=60)
+async def _list_fees_cached(limit: int, offset: int, session: AsyncSession):
+    return (await session.exec(_STMT_LIST_FEES.limit(limit).offset(offset))).all()
+
+@app.get("/fees/")
+async def list_fees(response: Response, limit: int = 50, offset: int = 0, session: AsyncSession = Depends(get_session)):
+    response.headers["X-Total-Count"] = str((await session.exec(_STMT_COUNT_FEES)).one())
+    return await _list_fees_cached(limit=limit, offset=offset, session=session)
+
+@app.get("/fees/{fee_id}")
+async def get_fee(fee_id: int, session: AsyncSession = Depends(get_session)):
+    db_fee = await session.get(ExamFee, fee_id)
     if not db_fee:
         raise HTTPException(status_code=404, detail="Fee not found")
-    return db_fee
+    return Response(
+        msgspec.json.encode(
+            ExamFeeReadMS(
+                id=db_fee.id, amount=db_fee.amount, due_date=db_fee.due_date, paid=db_fee.paid
+            )
+        ),
+        media_type="application/json",
+    )
 
 @app.put("/fees/{fee_id}", response_model=ExamFee)
-def update_fee(fee_id: int, fee: ExamFee, session: Session = Depends(get_session)):
-    db_fee = session.get(ExamFee, fee_id)
+async def update_fee(fee_id: int, fee: ExamFeeBase, session: AsyncSession = Depends(get_session)):
+    values = fee.model_dump(exclude_unset=True)
+    if values:
+        result = await session.exec(
+            update(ExamFee).where(ExamFee.id == fee_id).values(**values)
+        )
+        if result.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Fee not found")
+        await session.commit()
+        await clear_cache()
+    db_fee = await session.get(ExamFee, fee_id)
     if not db_fee:
         raise HTTPException(status_code=404, detail="Fee not found")
-    for key, val in fee.dict(exclude_unset=True).items():
-        setattr(db_fee, key, val)
-    session.commit()
-    session.refresh(db_fee)
     return db_fee
 
 @app.delete("/fees/{fee_id}", status_code=204)
-def delete_fee(fee_id: int, session: Session = Depends(get_session)):
-    db_fee = session.get(ExamFee, fee_id)
-    if not db_fee:
+async def delete_fee(fee_id: int, session: AsyncSession = Depends(get_session)):
+    result = await session.exec(delete(ExamFee).where(ExamFee.id == fee_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Fee not found")
-    session.delete(db_fee)
-    session.commit()
+    await session.commit()
+    await clear_cache()
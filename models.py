@@ -0,0 +1,106 @@
+"""SQLModel table definitions.
+
+These classes stay in a plain-Python module on purpose: the relationship
+annotations below are forward references (`List["Classroom"]` etc.), and
+Cython stores annotations as literal source strings that SQLModel cannot
+resolve at mapper-configuration time. Keeping the models interpreted lets
+setup.py compile the rest of main.py without breaking the ORM.
+"""
+
+from typing import List, Optional
+from datetime import date
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel, Relationship
+
+class ClassroomStudent(SQLModel, table=True):
+    # The composite PK covers (classroom_id, student_id) lookups; the extra
+    # index covers the reverse direction for per-student classroom listings.
+    __table_args__ = (
+        Index("ix_classroomstudent_student_classroom", "student_id", "classroom_id"),
+    )
+
+    classroom_id: Optional[int] = Field(
+        default=None, foreign_key="classroom.id", primary_key=True, ondelete="CASCADE"
+    )
+    student_id: Optional[int] = Field(
+        default=None, foreign_key="student.id", primary_key=True, ondelete="CASCADE"
+    )
+
+class StudentBase(SQLModel):
+    name: str
+    contact_number: str
+    dob: date
+
+class Student(StudentBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    classrooms: List["Classroom"] = Relationship(
+        back_populates="students", link_model=ClassroomStudent
+    )
+    issues: List["Issue"] = Relationship(back_populates="student")
+    results: List["ExamResult"] = Relationship(back_populates="student")
+    fees: List["ExamFee"] = Relationship(back_populates="student")
+
+class StaffBase(SQLModel):
+    name: str
+    contact_number: str
+    dob: date
+
+class Staff(StaffBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+class ClassroomBase(SQLModel):
+    class_name: str
+    std: str
+    sec: str
+    class_teacher: str
+
+class Classroom(ClassroomBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    students: List[Student] = Relationship(
+        back_populates="classrooms", link_model=ClassroomStudent
+    )
+
+class BookBase(SQLModel):
+    title: str
+    author: str
+    isbn: str
+    total_copies: int
+
+class Book(BookBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    available_copies: int = Field(default=0)
+    issues: List["Issue"] = Relationship(back_populates="book")
+
+class Issue(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    student_id: int = Field(foreign_key="student.id", index=True, ondelete="CASCADE")
+    book_id: int = Field(foreign_key="book.id", index=True)
+    issue_date: date = Field(default_factory=date.today)
+    return_date: Optional[date] = None
+
+    student: Student = Relationship(back_populates="issues")
+    book: Book = Relationship(back_populates="issues")
+
+class ExamResult(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    student_id: int = Field(foreign_key="student.id", index=True, ondelete="CASCADE")
+    exam_name: str
+    marks_obtained: float
+    max_marks: float
+
+    student: Student = Relationship(back_populates="results")
+
+# Fee writes go through this non-table base: table models skip Pydantic
+# coercion on request bodies, which would leave due_date as a string the
+# SQLite Date column rejects at flush time.
+class ExamFeeBase(SQLModel):
+    student_id: int = Field(foreign_key="student.id", index=True, ondelete="CASCADE")
+    amount: float
+    due_date: date
+    paid: bool = Field(default=False)
+
+class ExamFee(ExamFeeBase, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    student: Student = Relationship(back_populates="fees")